@@ -18,4 +18,5 @@ __all__ = [] # use of import * is discouraged
 from . import utilities
 # further, import main functions into this module's namespace
 from .utilities import print_contact, print_version, \
-                       exepath, exename, exedir, execute, SubprocessError
+                       exepath, exename, exedir, execute, make_executor, \
+                       SubprocessError
@@ -6,6 +6,7 @@
 #include <iostream> // cout, endl
 #include <cstdlib>  // exit, atoi
 #include <cstring>  // strcmp
+#include <string>   // string
 
 #include <basis/config.h>
 
@@ -32,6 +33,10 @@ int main(int argc, char *argv[])
             cout << "Hello, BASIS!" << endl;
         } else if (strcmp(argv[i], "--warn") == 0) {
             cerr << "WARNING: Cannot greet in other languages!" << endl;
+        } else if (strcmp(argv[i], "--flood") == 0) {
+            // write given number of bytes to STDERR, e.g., more than fits
+            // into the pipe buffer of the parent process
+            cerr << string(atoi(argv[++i]), 'x') << flush;
         } else if (strcmp(argv[i], "--exit") == 0) {
             exit(atoi(argv[++i]));
         }